@@ -1,5 +1,6 @@
 from calendario.api import (
     generate_calendar,
+    generate_calendar_nothrow,
     generate_ecuador_calendar,
     generate_multiple_calendars,
 )
@@ -13,6 +14,7 @@ __all__ = [
     "DayType",
     "ValidationError",
     "generate_calendar",
+    "generate_calendar_nothrow",
     "generate_ecuador_calendar",
     "generate_multiple_calendars",
 ]
@@ -1,13 +1,20 @@
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
+from functools import lru_cache
+from itertools import repeat
 
 from calendario.config.presets import get_ecuador_holidays
 from calendario.domain import Calendar
 from calendario.generation.generator import generate_calendar as _generate
+from calendario.generation.generator import (
+    generate_calendar_nothrow as _generate_nothrow,
+)
 
 
 def generate_calendar(
     year: int,
-    holidays: list[date] | None = None,
+    holidays: Sequence[date] | None = None,
     seed: int | None = None,
 ) -> Calendar:
     """
@@ -33,6 +40,34 @@ def generate_calendar(
     return _generate(year, holidays, seed)
 
 
+def generate_calendar_nothrow(
+    year: int,
+    holidays: Sequence[date] | None = None,
+    seed: int | None = None,
+) -> tuple[Calendar | None, str | None]:
+    """
+    Generate a calendar, returning the failure reason instead of raising.
+
+    Useful when retrying with different seeds until one succeeds.
+
+    Args:
+        year: Year to generate calendar for
+        holidays: Optional list of holiday dates
+        seed: Optional random seed for reproducibility
+
+    Returns:
+        (calendar, None) on success, (None, error message) if no valid
+        calendar could be generated with this seed
+
+    Raises:
+        ValueError: If year is invalid or holidays contain duplicates
+
+    Example:
+        >>> cal, error = generate_calendar_nothrow(2025, seed=42)
+    """
+    return _generate_nothrow(year, holidays, seed)
+
+
 def generate_ecuador_calendar(year: int, seed: int | None = None) -> Calendar:
     """
     Generate a calendar using Ecuador's official holidays.
@@ -51,38 +86,72 @@ def generate_ecuador_calendar(year: int, seed: int | None = None) -> Calendar:
     Example:
         >>> cal = generate_ecuador_calendar(2025, seed=42)
     """
-    holidays = get_ecuador_holidays(year)
-    return _generate(year, holidays, seed)
+    if seed is None:
+        return _generate(year, get_ecuador_holidays(year), seed)
+    return _generate_ecuador_seeded(year, seed)
+
+
+@lru_cache(maxsize=16)
+def _generate_ecuador_seeded(year: int, seed: int) -> Calendar:
+    """Seeded Ecuador calendars are deterministic and immutable, so share them"""
+    return _generate(year, get_ecuador_holidays(year), seed)
 
 
 def generate_multiple_calendars(
     year: int,
     num_workers: int,
-    holidays: list[date] | None = None,
+    holidays: Sequence[date] | None = None,
     base_seed: int | None = None,
+    *,
+    max_processes: int = 1,
 ) -> list[Calendar]:
     """
     Generate multiple calendars for different workers.
 
     Each worker gets a different calendar (using incremented seeds).
+    Calendars are independent, so callers with large batches can ask for
+    them to be generated in parallel worker processes.
 
     Args:
         year: Year to generate calendars for
         num_workers: Number of worker calendars to generate
         holidays: Optional list of holiday dates
         base_seed: Optional base seed (each worker gets base_seed + worker_index)
+        max_processes: Upper bound on generation processes. The default of
+            1 generates serially in this process; a calendar takes about a
+            millisecond, so a process pool only pays off for batches in the
+            hundreds.
 
     Returns:
         List of valid Calendar objects
 
+    Raises:
+        ValueError: If max_processes is less than 1
+
     Example:
         >>> calendars = generate_multiple_calendars(2025, num_workers=3, base_seed=100)
         >>> len(calendars)
         3
     """
-    calendars = []
-    for i in range(num_workers):
-        seed = (base_seed + i) if base_seed is not None else None
-        calendar = _generate(year, holidays, seed)
-        calendars.append(calendar)
-    return calendars
+    if max_processes < 1:
+        msg = f"max_processes must be at least 1, got {max_processes}"
+        raise ValueError(msg)
+
+    seeds = [
+        (base_seed + i) if base_seed is not None else None for i in range(num_workers)
+    ]
+
+    max_processes = min(max_processes, num_workers)
+
+    if max_processes <= 1:
+        return [_generate(year, holidays, seed) for seed in seeds]
+
+    with ProcessPoolExecutor(max_workers=max_processes) as executor:
+        return list(
+            executor.map(
+                _generate,
+                repeat(year, num_workers),
+                repeat(holidays, num_workers),
+                seeds,
+            )
+        )
@@ -1,39 +1,28 @@
 from datetime import date
+from functools import cache
 
 
-ECUADOR_HOLIDAYS = {
-    2025: [
-        date(2025, 1, 1),
-        date(2025, 1, 2),
-        date(2025, 2, 16),
-        date(2025, 2, 17),
-        date(2025, 4, 3),
-        date(2025, 5, 1),
-        date(2025, 5, 25),
-        date(2025, 8, 10),
-        date(2025, 10, 9),
-        date(2025, 11, 2),
-        date(2025, 11, 3),
-        date(2025, 12, 25),
-    ],
-    2026: [
-        date(2026, 1, 1),
-        date(2026, 1, 2),
-        date(2026, 2, 16),
-        date(2026, 2, 17),
-        date(2026, 4, 3),
-        date(2026, 5, 1),
-        date(2026, 5, 25),
-        date(2026, 8, 10),
-        date(2026, 10, 9),
-        date(2026, 11, 2),
-        date(2026, 11, 3),
-        date(2026, 12, 25),
-    ],
-}
-
-
-def get_ecuador_holidays(year: int) -> list[date]:
+# Preset holidays as (month, day); the same dates apply to every preset year
+ECUADOR_HOLIDAY_DATES = (
+    (1, 1),
+    (1, 2),
+    (2, 16),
+    (2, 17),
+    (4, 3),
+    (5, 1),
+    (5, 25),
+    (8, 10),
+    (10, 9),
+    (11, 2),
+    (11, 3),
+    (12, 25),
+)
+
+ECUADOR_PRESET_YEARS = frozenset({2025, 2026})
+
+
+@cache
+def get_ecuador_holidays(year: int) -> tuple[date, ...]:
     """
     Get Ecuador's official holidays for a specific year.
 
@@ -41,12 +30,29 @@ def get_ecuador_holidays(year: int) -> list[date]:
         year: Year to get holidays for
 
     Returns:
-        List of holiday dates
+        Tuple of holiday dates, sorted
 
     Raises:
         ValueError: If no preset exists for the year
     """
-    if year not in ECUADOR_HOLIDAYS:
+    if year not in ECUADOR_PRESET_YEARS:
         msg = f"No Ecuador holidays preset for year {year}"
         raise ValueError(msg)
-    return ECUADOR_HOLIDAYS[year]
+    return tuple(date(year, month, day) for month, day in ECUADOR_HOLIDAY_DATES)
+
+
+@cache
+def get_ecuador_holiday_set(year: int) -> frozenset[date]:
+    """
+    Get Ecuador's official holidays for a year as a set, for membership tests.
+
+    Args:
+        year: Year to get holidays for
+
+    Returns:
+        Frozen set of holiday dates
+
+    Raises:
+        ValueError: If no preset exists for the year
+    """
+    return frozenset(get_ecuador_holidays(year))
@@ -1,7 +1,9 @@
+import zlib
+
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from functools import cached_property
 
 
 class DayType(Enum):
@@ -14,33 +16,53 @@ class DayType(Enum):
     WORKING_HOLIDAY = "working_holiday"
 
 
-@dataclass(frozen=True)
+_WORK_TYPES = frozenset({DayType.WORK, DayType.ORDERING, DayType.WORKING_HOLIDAY})
+_REST_TYPES = frozenset({DayType.REST, DayType.HOLIDAY})
+_HOLIDAY_TYPES = frozenset({DayType.HOLIDAY, DayType.WORKING_HOLIDAY})
+
+# (is_work_day, is_rest_day) shared by every Day of a given type
+_DAY_TYPE_FLAGS = {
+    day_type: (day_type in _WORK_TYPES, day_type in _REST_TYPES) for day_type in DayType
+}
+
+# One byte per day type, for Calendar.fingerprint
+_DAY_TYPE_CODES = {day_type: code for code, day_type in enumerate(DayType)}
+
+
+@dataclass(frozen=True, slots=True)
 class Day:
     """A single day in the calendar with its type"""
 
     date: date
     day_type: DayType
+    is_work_day: bool = field(init=False, repr=False, compare=False)
+    is_rest_day: bool = field(init=False, repr=False, compare=False)
 
-    @cached_property
-    def is_work_day(self) -> bool:
-        return self.day_type in (
-            DayType.WORK,
-            DayType.ORDERING,
-            DayType.WORKING_HOLIDAY,
-        )
-
-    @cached_property
-    def is_rest_day(self) -> bool:
-        return self.day_type in (DayType.REST, DayType.HOLIDAY)
+    def __post_init__(self) -> None:
+        is_work_day, is_rest_day = _DAY_TYPE_FLAGS[self.day_type]
+        object.__setattr__(self, "is_work_day", is_work_day)
+        object.__setattr__(self, "is_rest_day", is_rest_day)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class Calendar:
     """A complete year calendar with all days"""
 
     year: int
     days: tuple[Day, ...]
-    _index: dict[date, Day] = field(default_factory=dict, init=False, repr=False)
+    _start_ordinal: int = field(default=0, init=False, repr=False, compare=False)
+    _month_index: dict[int, tuple[Day, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _work_blocks: tuple[tuple[Day, ...], ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+    _rest_blocks: tuple[tuple[Day, ...], ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+    _holiday_days: tuple[Day, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if not self.days:
@@ -51,44 +73,84 @@ class Calendar:
             msg = "All days must be from the same year"
             raise ValueError(msg)
 
-        index = {day.date: day for day in self.days}
-        object.__setattr__(self, "_index", index)
+        start_ordinal = self.days[0].date.toordinal()
+        months: dict[int, list[Day]] = {month: [] for month in range(1, 13)}
+        holiday_days = []
+        for offset, day in enumerate(self.days):
+            if day.date.toordinal() != start_ordinal + offset:
+                msg = f"Calendar days must be consecutive, gap before {day.date}"
+                raise ValueError(msg)
+            months[day.date.month].append(day)
+            if day.day_type in _HOLIDAY_TYPES:
+                holiday_days.append(day)
+
+        month_index = {month: tuple(days) for month, days in months.items()}
+        object.__setattr__(self, "_start_ordinal", start_ordinal)
+        object.__setattr__(self, "_month_index", month_index)
+        object.__setattr__(self, "_holiday_days", tuple(holiday_days))
+        # Validation reads both block lists on every calendar, so build them once
+        object.__setattr__(
+            self, "_work_blocks", _group_runs(self.days, lambda day: day.is_work_day)
+        )
+        object.__setattr__(
+            self,
+            "_rest_blocks",
+            _group_runs(self.days, lambda day: day.day_type == DayType.REST),
+        )
 
     def get_day(self, d: date) -> Day:
-        """Get a specific day from the calendar"""
-        return self._index[d]
+        """
+        Get a specific day from the calendar.
+
+        Raises:
+            KeyError: If the date is not in the calendar
+        """
+        offset = d.toordinal() - self._start_ordinal
+        if not 0 <= offset < len(self.days):
+            raise KeyError(d)
+        return self.days[offset]
 
     def get_month_days(self, month: int) -> tuple[Day, ...]:
         """Get all days for a specific month"""
         if not 1 <= month <= 12:
             msg = f"Month must be 1-12, got {month}"
             raise ValueError(msg)
-        return tuple(d for d in self.days if d.date.month == month)
+        return self._month_index[month]
+
+    def fingerprint(self) -> int:
+        """
+        Get a CRC32 of the day type sequence.
 
-    def get_work_blocks(self) -> list[list[Day]]:
+        Cheaper to compare than the full days tuple; calendars of the same
+        year with the same day types share a fingerprint.
+        """
+        return zlib.crc32(bytes(_DAY_TYPE_CODES[day.day_type] for day in self.days))
+
+    def get_holiday_days(self) -> tuple[Day, ...]:
+        """Get all HOLIDAY and WORKING_HOLIDAY days, in date order"""
+        return self._holiday_days
+
+    def get_work_blocks(self) -> tuple[tuple[Day, ...], ...]:
         """Get all work blocks (consecutive work days)"""
-        blocks = []
-        current = []
-        for day in self.days:
-            if day.is_work_day:
-                current.append(day)
-            elif current:
-                blocks.append(current)
-                current = []
-        if current:
-            blocks.append(current)
-        return blocks
-
-    def get_rest_blocks(self) -> list[list[Day]]:
+        return self._work_blocks
+
+    def get_rest_blocks(self) -> tuple[tuple[Day, ...], ...]:
         """Get all REST blocks (consecutive REST days, not holidays)"""
-        blocks = []
-        current = []
-        for day in self.days:
-            if day.day_type == DayType.REST:
-                current.append(day)
-            elif current:
-                blocks.append(current)
-                current = []
-        if current:
-            blocks.append(current)
-        return blocks
+        return self._rest_blocks
+
+
+def _group_runs(
+    days: tuple[Day, ...], predicate: Callable[[Day], bool]
+) -> tuple[tuple[Day, ...], ...]:
+    """Group consecutive days matching predicate into blocks"""
+    blocks = []
+    current: list[Day] = []
+    for day in days:
+        if predicate(day):
+            current.append(day)
+        elif current:
+            blocks.append(tuple(current))
+            current = []
+    if current:
+        blocks.append(tuple(current))
+    return tuple(blocks)
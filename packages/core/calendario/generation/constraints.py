@@ -1,25 +1,37 @@
+from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import NamedTuple
 
-from calendario.domain import DayType
+from calendario.domain import Day, DayType
+
+
+# Shared step for date walks; building timedelta(days=1) per step is costly
+ONE_DAY = timedelta(days=1)
 
 
 class ScheduleState(NamedTuple):
-    """Immutable state during calendar generation"""
+    """Immutable snapshot of calendar generation state"""
 
     current_date: date
-    days_so_far: tuple
+    days_so_far: tuple[Day, ...]
     weeks_with_rest: frozenset[int]
     months_with_weekend: frozenset[int]
+    work_streak: int | None = None
 
     @property
-    def last_day(self):
+    def last_day(self) -> Day | None:
         """Get the last placed day, if any"""
         return self.days_so_far[-1] if self.days_so_far else None
 
     @property
     def current_work_streak(self) -> int:
-        """Count consecutive work days at end of days_so_far"""
+        """Count consecutive work days at end of days_so_far
+
+        Uses the tracked work_streak when set; states built by hand without
+        it fall back to scanning days_so_far.
+        """
+        if self.work_streak is not None:
+            return self.work_streak
         count = 0
         for day in reversed(self.days_so_far):
             if day.is_work_day:
@@ -29,13 +41,45 @@ class ScheduleState(NamedTuple):
         return count
 
 
-def needs_rest_this_week(state: ScheduleState, current_date: date) -> bool:
+@dataclass(slots=True)
+class ScheduleBuilder:
+    """Mutable state during calendar generation, updated in place"""
+
+    current_date: date
+    days_so_far: list[Day] = field(default_factory=list)
+    weeks_with_rest: set[int] = field(default_factory=set)
+    months_with_weekend: set[int] = field(default_factory=set)
+    # Maintained by the placement functions rather than derived on each read
+    last_day: Day | None = None
+    work_streak: int = 0
+
+    @property
+    def current_work_streak(self) -> int:
+        """Count consecutive work days at end of days_so_far"""
+        return self.work_streak
+
+    def snapshot(self) -> ScheduleState:
+        """Freeze the current state into an immutable ScheduleState"""
+        return ScheduleState(
+            current_date=self.current_date,
+            days_so_far=tuple(self.days_so_far),
+            weeks_with_rest=frozenset(self.weeks_with_rest),
+            months_with_weekend=frozenset(self.months_with_weekend),
+            work_streak=self.work_streak,
+        )
+
+
+def needs_rest_this_week(
+    state: ScheduleState | ScheduleBuilder, current_date: date
+) -> bool:
     """Check if current week still needs a rest block"""
     week_num = current_date.isocalendar()[1]
     return week_num not in state.weeks_with_rest
 
 
-def needs_weekend_this_month(state: ScheduleState, current_date: date) -> bool:
+def needs_weekend_this_month(
+    state: ScheduleState | ScheduleBuilder, current_date: date
+) -> bool:
     """Check if current month still needs a weekend (Sat-Sun rest)"""
     return current_date.month not in state.months_with_weekend
 
@@ -64,14 +108,14 @@ def can_place_rest_at(start_date: date, holiday_map: dict[date, DayType]) -> boo
     if would_create_sunday_monday_rest(start_date):
         return False
 
-    end_date = start_date + timedelta(days=1)
+    end_date = start_date + ONE_DAY
 
     # Can't overwrite holidays
     if start_date in holiday_map or end_date in holiday_map:
         return False
 
     # Can't merge with next day if it's a HOLIDAY (creates 3+ day rest)
-    next_day = end_date + timedelta(days=1)
+    next_day = end_date + ONE_DAY
     return not (next_day in holiday_map and holiday_map[next_day] == DayType.HOLIDAY)
 
 
@@ -80,7 +124,7 @@ def is_saturday(d: date) -> bool:
     return d.weekday() == 5
 
 
-def max_work_days_remaining(state: ScheduleState) -> int:
+def max_work_days_remaining(state: ScheduleState | ScheduleBuilder) -> int:
     """
     Maximum work days we can place before hitting the 7-day work block limit.
 
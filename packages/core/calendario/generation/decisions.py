@@ -1,8 +1,10 @@
-from datetime import date, timedelta
+from datetime import date
 from random import Random
 
 from calendario.domain import DayType
 from calendario.generation.constraints import (
+    ONE_DAY,
+    ScheduleBuilder,
     ScheduleState,
     can_place_rest_at,
     max_work_days_remaining,
@@ -12,7 +14,7 @@ from calendario.generation.constraints import (
 
 
 def decide_work_block_length(
-    state: ScheduleState,
+    state: ScheduleState | ScheduleBuilder,
     current_date: date,
     holiday_map: dict[date, DayType],
     rng: Random,
@@ -37,19 +39,23 @@ def decide_work_block_length(
     Raises:
         ValueError: If no valid length exists (algorithm bug)
     """
-    valid_lengths = []
+    # Rest start per valid length, reused by the Friday steering below
+    rest_starts: dict[int, date] = {}
 
     max_length = min(7, max_work_days_remaining(state))
 
     for length in range(3, max_length + 1):
-        if is_valid_work_length(state, current_date, length, holiday_map):
-            valid_lengths.append(length)
+        rest_start = simulate_work_placement(current_date, length, holiday_map)
+        if is_valid_rest_start(state, current_date, rest_start, holiday_map):
+            rest_starts[length] = rest_start
+
+    valid_lengths = list(rest_starts)
 
     if not valid_lengths:
         msg = (
             f"No valid work length at {current_date} - algorithm error! "
-            f"State: weeks_with_rest={state.weeks_with_rest}, "
-            f"months_with_weekend={state.months_with_weekend}"
+            f"State: weeks_with_rest={frozenset(state.weeks_with_rest)}, "
+            f"months_with_weekend={frozenset(state.months_with_weekend)}"
         )
         raise ValueError(msg)
 
@@ -57,8 +63,8 @@ def decide_work_block_length(
     if needs_weekend_this_month(state, current_date):
         friday_landing = [
             length
-            for length in valid_lengths
-            if lands_on_friday(current_date, length, holiday_map)
+            for length, rest_start in rest_starts.items()
+            if rest_start.weekday() == 4
         ]
         if friday_landing:
             return rng.choice(friday_landing)
@@ -67,7 +73,7 @@ def decide_work_block_length(
 
 
 def is_valid_work_length(
-    state: ScheduleState,
+    state: ScheduleState | ScheduleBuilder,
     start_date: date,
     length: int,
     holiday_map: dict[date, DayType],
@@ -96,6 +102,27 @@ def is_valid_work_length(
     # Simulate placement to find where rest would start
     rest_start = simulate_work_placement(start_date, length, holiday_map)
 
+    return is_valid_rest_start(state, start_date, rest_start, holiday_map)
+
+
+def is_valid_rest_start(
+    state: ScheduleState | ScheduleBuilder,
+    start_date: date,
+    rest_start: date,
+    holiday_map: dict[date, DayType],
+) -> bool:
+    """
+    Check if a work block from start_date may end with rest at rest_start.
+
+    Args:
+        state: Current schedule state
+        start_date: Where work block would start
+        rest_start: Where rest would start (from simulate_work_placement)
+        holiday_map: Holiday mapping
+
+    Returns:
+        True if rest can follow the work block at rest_start
+    """
     # Check if we're still in the same year
     if rest_start.year != start_date.year:
         return False
@@ -137,7 +164,7 @@ def simulate_work_placement(
         # Skip holidays (they don't count toward work length)
         if current not in holiday_map:
             work_days_placed += 1
-        current += timedelta(days=1)
+        current += ONE_DAY
 
     return current
 
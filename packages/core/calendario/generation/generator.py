@@ -1,15 +1,16 @@
+from collections.abc import Sequence
 from datetime import date
 from random import Random
 
-from calendario.domain import Calendar
+from calendario.domain import Calendar, DayType
 from calendario.generation.holidays import process_holidays
 from calendario.generation.schedule import build_schedule
-from calendario.validation.validator import validate_calendar
+from calendario.validation.validator import ValidationError, validate_calendar
 
 
 def generate_calendar(
     year: int,
-    holidays: list[date] | None = None,
+    holidays: Sequence[date] | None = None,
     seed: int | None = None,
 ) -> Calendar:
     """
@@ -45,32 +46,80 @@ def generate_calendar(
         >>> cal.get_day(date(2025, 1, 1)).day_type
         DayType.HOLIDAY
     """
-    # Validate inputs
-    if year < 1:
-        msg = f"Invalid year: {year}"
-        raise ValueError(msg)
+    holiday_map = _validated_holiday_map(year, holidays)
+    return _build_valid_calendar(year, holiday_map, seed)
 
-    holidays = holidays or []
 
-    if holidays and not all(h.year == year for h in holidays):
-        msg = "All holidays must be in the target year"
-        raise ValueError(msg)
+def generate_calendar_nothrow(
+    year: int,
+    holidays: Sequence[date] | None = None,
+    seed: int | None = None,
+) -> tuple[Calendar | None, str | None]:
+    """
+    Generate a calendar, reporting generation failures instead of raising.
 
-    if len(holidays) != len(set(holidays)):
-        msg = "Duplicate holidays found"
-        raise ValueError(msg)
+    For callers that retry with other seeds: a schedule that cannot be
+    completed or fails validation is returned as an error message.
+
+    Args:
+        year: Year to generate (must be >= 1)
+        holidays: Optional list of holiday dates
+        seed: Optional random seed for reproducibility
+
+    Returns:
+        (calendar, None) on success, (None, error message) on failure
 
-    # Process holidays into typed map
-    holiday_map = process_holidays(holidays)
+    Raises:
+        ValueError: If inputs are invalid
+    """
+    holiday_map = _validated_holiday_map(year, holidays)
+    try:
+        return _build_valid_calendar(year, holiday_map, seed), None
+    except (ValueError, ValidationError) as e:
+        return None, str(e)
 
+
+def _build_valid_calendar(
+    year: int, holiday_map: dict[date, DayType], seed: int | None
+) -> Calendar:
+    """Build and validate a calendar from already checked inputs."""
     # Generate schedule
     rng = Random(seed) if seed is not None else Random()
     days = build_schedule(year, holiday_map, rng)
 
-    # Build calendar
-    calendar = Calendar(year, days)
+    # Build calendar; a schedule Calendar rejects (e.g. one with gaps) is
+    # an algorithm bug, not bad input, so report it as a validation failure
+    try:
+        calendar = Calendar(year, days)
+    except ValueError as e:
+        msg = f"Calendar validation failed:\n  - {e}"
+        raise ValidationError(msg) from e
 
-    # Validate (should always pass with correct algorithm)
-    validate_calendar(calendar)
+    # Validate (should always pass with correct algorithm); callers only
+    # need to know that it failed, so stop at the first broken rule
+    validate_calendar(calendar, fail_fast=True)
 
     return calendar
+
+
+def _validated_holiday_map(
+    year: int, holidays: Sequence[date] | None
+) -> dict[date, DayType]:
+    """Check generation inputs and build the typed holiday map."""
+    if year < 1:
+        msg = f"Invalid year: {year}"
+        raise ValueError(msg)
+
+    holidays = holidays or ()
+
+    seen: set[date] = set()
+    for holiday in holidays:
+        if holiday.year != year:
+            msg = "All holidays must be in the target year"
+            raise ValueError(msg)
+        if holiday in seen:
+            msg = "Duplicate holidays found"
+            raise ValueError(msg)
+        seen.add(holiday)
+
+    return process_holidays(holidays)
@@ -1,9 +1,11 @@
+from collections.abc import Sequence
 from datetime import date
+from itertools import pairwise
 
 from calendario.domain import DayType
 
 
-def process_holidays(holidays: list[date]) -> dict[date, DayType]:
+def process_holidays(holidays: Sequence[date]) -> dict[date, DayType]:
     """
     Process holidays into a typed map.
 
@@ -14,7 +16,7 @@ def process_holidays(holidays: list[date]) -> dict[date, DayType]:
     - Blocks of 3+ are invalid
 
     Args:
-        holidays: List of holiday dates (will be deduplicated and sorted)
+        holidays: Holiday dates (will be deduplicated and sorted)
 
     Returns:
         Map of date → DayType
@@ -46,22 +48,26 @@ def process_holidays(holidays: list[date]) -> dict[date, DayType]:
     return result
 
 
-def _group_consecutive_holidays(holidays: list[date]) -> list[list[date]]:
+def _group_consecutive_holidays(holidays: Sequence[date]) -> list[list[date]]:
     """Group consecutive holiday dates into blocks"""
     if not holidays:
         return []
 
-    sorted_holidays = sorted(set(holidays))
+    # Group on ordinals so adjacency is a plain integer comparison
+    ordinals = [holiday.toordinal() for holiday in holidays]
+    # Presets are already sorted and unique; only normalize arbitrary input
+    if not all(a < b for a, b in pairwise(ordinals)):
+        ordinals = sorted(set(ordinals))
+
     blocks = []
-    current_block = [sorted_holidays[0]]
+    current_block = [ordinals[0]]
 
-    for holiday in sorted_holidays[1:]:
-        days_diff = (holiday - current_block[-1]).days
-        if days_diff == 1:
-            current_block.append(holiday)
+    for ordinal in ordinals[1:]:
+        if ordinal - current_block[-1] == 1:
+            current_block.append(ordinal)
         else:
             blocks.append(current_block)
-            current_block = [holiday]
+            current_block = [ordinal]
 
     blocks.append(current_block)
-    return blocks
+    return [[date.fromordinal(ordinal) for ordinal in block] for block in blocks]
@@ -1,9 +1,10 @@
-from datetime import date, timedelta
+from datetime import date
 from random import Random
 
 from calendario.domain import Day, DayType
 from calendario.generation.constraints import (
-    ScheduleState,
+    ONE_DAY,
+    ScheduleBuilder,
     can_place_rest_at,
 )
 from calendario.generation.decisions import decide_work_block_length
@@ -33,68 +34,54 @@ def build_schedule(
     Raises:
         ValueError: If algorithm encounters impossible constraint (bug)
     """
-    state = ScheduleState(
-        current_date=date(year, 1, 1),
-        days_so_far=(),
-        weeks_with_rest=frozenset(),
-        months_with_weekend=frozenset(),
-    )
-
-    while state.current_date.year == year:
+    state = ScheduleBuilder(current_date=date(year, 1, 1))
+    year_end = date(year, 12, 31)
+
+    while state.current_date <= year_end:
         # Handle holidays first
         if state.current_date in holiday_map:
-            state = place_holiday(state, holiday_map)
+            place_holiday(state, holiday_map)
             continue
 
         # Place work block
-        state = place_work_block(state, holiday_map, rng)
+        place_work_block(state, holiday_map, rng)
 
         # Place rest block (if still in year)
-        if state.current_date.year == year:
-            state = place_rest_block(state, holiday_map)
+        if state.current_date <= year_end:
+            place_rest_block(state, holiday_map)
 
-    return state.days_so_far
+    return tuple(state.days_so_far)
 
 
-def place_holiday(
-    state: ScheduleState, holiday_map: dict[date, DayType]
-) -> ScheduleState:
+def place_holiday(state: ScheduleBuilder, holiday_map: dict[date, DayType]) -> None:
     """
     Place a single holiday day and advance state.
 
     Args:
-        state: Current state
+        state: Current state, updated in place
         holiday_map: Holiday mapping
-
-    Returns:
-        New state with holiday placed
     """
     day = Day(state.current_date, holiday_map[state.current_date])
 
-    return ScheduleState(
-        current_date=state.current_date + timedelta(days=1),
-        days_so_far=(*state.days_so_far, day),
-        weeks_with_rest=state.weeks_with_rest,
-        months_with_weekend=state.months_with_weekend,
-    )
+    state.days_so_far.append(day)
+    state.last_day = day
+    state.current_date += ONE_DAY
+    state.work_streak = state.work_streak + 1 if day.is_work_day else 0
 
 
 def place_work_block(
-    state: ScheduleState, holiday_map: dict[date, DayType], rng: Random
-) -> ScheduleState:
+    state: ScheduleBuilder, holiday_map: dict[date, DayType], rng: Random
+) -> None:
     """
-    Place a work block (3-7 days) and return updated state.
+    Place a work block (3-7 days) and advance state.
 
     First work day after rest is ORDERING, others are WORK.
     Skips over holidays (they'll be handled in main loop).
 
     Args:
-        state: Current state
+        state: Current state, updated in place
         holiday_map: Holiday mapping
         rng: Random generator
-
-    Returns:
-        New state with work block placed
     """
     work_length = decide_work_block_length(state, state.current_date, holiday_map, rng)
 
@@ -106,7 +93,7 @@ def place_work_block(
     while work_days_placed < work_length and current.year == state.current_date.year:
         if current in holiday_map:
             # Skip - will be handled in main loop
-            current += timedelta(days=1)
+            current += ONE_DAY
             continue
 
         # First work day after rest is ORDERING
@@ -116,33 +103,27 @@ def place_work_block(
             day_type = DayType.WORK
 
         new_days.append(Day(current, day_type))
-        current += timedelta(days=1)
+        current += ONE_DAY
         work_days_placed += 1
 
-    return ScheduleState(
-        current_date=current,
-        days_so_far=state.days_so_far + tuple(new_days),
-        weeks_with_rest=state.weeks_with_rest,
-        months_with_weekend=state.months_with_weekend,
-    )
+    if new_days:
+        state.days_so_far.extend(new_days)
+        state.last_day = new_days[-1]
+    state.current_date = current
+    state.work_streak += len(new_days)
 
 
-def place_rest_block(
-    state: ScheduleState, holiday_map: dict[date, DayType]
-) -> ScheduleState:
+def place_rest_block(state: ScheduleBuilder, holiday_map: dict[date, DayType]) -> None:
     """
-    Place a 2-day rest block and return updated state.
+    Place a 2-day rest block and advance state.
 
     If rest starts on Saturday, marks month as having weekend.
     Tracks which week has received rest.
 
     Args:
-        state: Current state
+        state: Current state, updated in place
         holiday_map: Holiday mapping
 
-    Returns:
-        New state with rest block placed
-
     Raises:
         ValueError: If rest cannot be placed (algorithm bug)
     """
@@ -155,7 +136,7 @@ def place_rest_block(
         raise ValueError(msg)
 
     day1 = Day(state.current_date, DayType.REST)
-    day2_date = state.current_date + timedelta(days=1)
+    day2_date = state.current_date + ONE_DAY
 
     new_days = [day1]
 
@@ -164,17 +145,13 @@ def place_rest_block(
         new_days.append(Day(day2_date, DayType.REST))
 
     # Track that this week has rest
-    week_num = state.current_date.isocalendar()[1]
-    new_weeks_with_rest = state.weeks_with_rest | {week_num}
+    state.weeks_with_rest.add(state.current_date.isocalendar()[1])
 
     # Track weekend if this is Saturday-Sunday
-    new_months_with_weekend = state.months_with_weekend
     if state.current_date.weekday() == 5:  # Saturday
-        new_months_with_weekend = state.months_with_weekend | {state.current_date.month}
-
-    return ScheduleState(
-        current_date=day2_date + timedelta(days=1),
-        days_so_far=state.days_so_far + tuple(new_days),
-        weeks_with_rest=new_weeks_with_rest,
-        months_with_weekend=new_months_with_weekend,
-    )
+        state.months_with_weekend.add(state.current_date.month)
+
+    state.days_so_far.extend(new_days)
+    state.last_day = new_days[-1]
+    state.current_date = day2_date + ONE_DAY
+    state.work_streak = 0
@@ -1,4 +1,7 @@
-from datetime import timedelta
+from collections import Counter
+from datetime import date
+from functools import lru_cache
+from itertools import pairwise
 
 from calendario.domain import Calendar, DayType
 
@@ -11,11 +14,7 @@ def validate_holiday_pairing(calendar: Calendar) -> list[str]:
     - Consecutive pairs: first is WORKING_HOLIDAY, second is HOLIDAY
     """
     errors = []
-    days = calendar.days
-
-    holiday_days = [
-        d for d in days if d.day_type in (DayType.HOLIDAY, DayType.WORKING_HOLIDAY)
-    ]
+    holiday_days = calendar.get_holiday_days()
 
     i = 0
     while i < len(holiday_days):
@@ -65,24 +64,7 @@ def validate_rest_blocks(calendar: Calendar) -> list[str]:
 
 def validate_ordering_placement(calendar: Calendar) -> list[str]:
     """REQ3: First work day after rest must be ORDERING"""
-    errors = []
-    days = calendar.days
-
-    for i in range(1, len(days)):
-        previous = days[i - 1]
-        current = days[i]
-
-        if (
-            previous.is_rest_day
-            and current.is_work_day
-            and current.day_type != DayType.ORDERING
-        ):
-            errors.append(
-                f"Expected ORDERING at {current.date} after rest, "
-                f"got {current.day_type.value}"
-            )
-
-    return errors
+    return _check_day_sequence(calendar)[0]
 
 
 def validate_work_block_lengths(calendar: Calendar) -> list[str]:
@@ -107,15 +89,13 @@ def validate_monthly_weekends(calendar: Calendar) -> list[str]:
         month_days = calendar.get_month_days(month)
         free_weekends = 0
 
-        for i in range(len(month_days) - 1):
-            day1 = month_days[i]
-            day2 = month_days[i + 1]
-
+        # Compare types first so weekday() only runs on REST pairs
+        for day1, day2 in pairwise(month_days):
             if (
-                day1.date.weekday() == 5  # Saturday
-                and day2.date.weekday() == 6  # Sunday
-                and day1.day_type == DayType.REST
+                day1.day_type == DayType.REST
                 and day2.day_type == DayType.REST
+                and day1.date.weekday() == 5  # Saturday
+                and day2.date.weekday() == 6  # Sunday
             ):
                 free_weekends += 1
 
@@ -129,60 +109,91 @@ def validate_monthly_weekends(calendar: Calendar) -> list[str]:
 
 def validate_weekly_rest(calendar: Calendar) -> list[str]:
     """REQ6: Each ISO week must have exactly one rest block"""
-    errors = []
+    week1_monday = _get_week1_monday_ordinal(calendar.year)
+    rest_blocks_per_week: Counter[int] = Counter()
+
+    # A block that crosses into the next week is split there; each part
+    # counts one rest block per full pair of REST days it holds
+    for block in calendar.get_rest_blocks():
+        offset = block[0].date.toordinal() - week1_monday
+        remaining = len(block)
+        while remaining:
+            span = min(remaining, 7 - offset % 7)
+            rest_blocks_per_week[offset // 7 + 1] += span // 2
+            offset += span
+            remaining -= span
 
-    week_numbers = _get_all_iso_weeks(calendar.year)
-
-    for week_num in week_numbers:
-        week_dates = _get_week_dates(calendar.year, week_num)
-
-        # Count rest blocks in this week
-        rest_blocks = 0
-        i = 0
-        while i < len(week_dates):
-            try:
-                day = calendar.get_day(week_dates[i])
-                if day.day_type == DayType.REST:
-                    # Start of rest block
-                    if i + 1 < len(week_dates):
-                        next_day = calendar.get_day(week_dates[i + 1])
-                        if next_day.day_type == DayType.REST:
-                            rest_blocks += 1
-                            i += 2
-                            continue
-                    i += 1
-                else:
-                    i += 1
-            except KeyError:
-                i += 1
+    return [
+        f"Week {week_num} has {rest_blocks} rest blocks (must be 1)"
+        for week_num in _get_all_iso_weeks(calendar.year)
+        if (rest_blocks := rest_blocks_per_week[week_num]) != 1
+    ]
 
-        if rest_blocks != 1:
-            errors.append(f"Week {week_num} has {rest_blocks} rest blocks (must be 1)")
 
-    return errors
+def check_weekly_rest_days(calendar: Calendar) -> list[str]:
+    """
+    Quick pre-check: each ISO week must hold exactly two REST days.
+
+    A calendar meeting REQ2, REQ6 and REQ7 has one 2-day rest block inside
+    every week, so any other count means it is invalid. This only needs
+    the rest blocks, so it is cheaper than running the full rules.
+    """
+    week1_monday = _get_week1_monday_ordinal(calendar.year)
+    rest_days_per_week: Counter[int] = Counter()
+
+    for block in calendar.get_rest_blocks():
+        for day in block:
+            rest_days_per_week[(day.date.toordinal() - week1_monday) // 7 + 1] += 1
+
+    return [
+        f"Week {week_num} has {rest_days} REST days (must be 2)"
+        for week_num in _get_all_iso_weeks(calendar.year)
+        if (rest_days := rest_days_per_week[week_num]) != 2
+    ]
 
 
 def validate_no_sunday_monday_rest(calendar: Calendar) -> list[str]:
     """REQ7: No Sunday-Monday REST blocks allowed"""
-    errors = []
-    days = calendar.days
-
-    for i in range(len(days) - 1):
-        if (
-            days[i].day_type == DayType.REST
-            and days[i + 1].day_type == DayType.REST
-            and days[i].date.weekday() == 6  # Sunday
-            and days[i + 1].date.weekday() == 0  # Monday
+    return _check_day_sequence(calendar)[1]
+
+
+def validate_day_sequence(calendar: Calendar) -> list[str]:
+    """REQ3 and REQ7 together, in a single pass over consecutive days"""
+    ordering_errors, sunday_monday_errors = _check_day_sequence(calendar)
+    return ordering_errors + sunday_monday_errors
+
+
+def _check_day_sequence(calendar: Calendar) -> tuple[list[str], list[str]]:
+    """Collect REQ3 and REQ7 errors from one walk over day pairs"""
+    ordering_errors = []
+    sunday_monday_errors = []
+
+    # Both rules only look at pairs that follow a rest day
+    for previous, current in pairwise(calendar.days):
+        if not previous.is_rest_day:
+            continue
+
+        if current.is_work_day:
+            if current.day_type != DayType.ORDERING:
+                ordering_errors.append(
+                    f"Expected ORDERING at {current.date} after rest, "
+                    f"got {current.day_type.value}"
+                )
+        elif (
+            previous.day_type == DayType.REST
+            and current.day_type == DayType.REST
+            and previous.date.weekday() == 6  # Sunday, so current is Monday
         ):
-            errors.append(f"Invalid Sunday-Monday rest block at {days[i].date}")
+            sunday_monday_errors.append(
+                f"Invalid Sunday-Monday rest block at {previous.date}"
+            )
 
-    return errors
+    return ordering_errors, sunday_monday_errors
 
 
-def _get_all_iso_weeks(year: int) -> list[int]:
+@lru_cache(maxsize=8)
+def _get_all_iso_weeks(year: int) -> tuple[int, ...]:
     """Get all ISO week numbers for the year"""
-    from datetime import date
-
     jan_1 = date(year, 1, 1)
     dec_31 = date(year, 12, 31)
 
@@ -197,17 +208,11 @@ def _get_all_iso_weeks(year: int) -> list[int]:
         dec_28 = date(year, 12, 28)
         end_week = dec_28.isocalendar()[1]
 
-    return list(range(start_week, end_week + 1))
-
+    return tuple(range(start_week, end_week + 1))
 
-def _get_week_dates(year: int, week_number: int) -> list:
-    """Get all dates in an ISO week that fall within the year"""
-    from datetime import date
 
+@lru_cache(maxsize=8)
+def _get_week1_monday_ordinal(year: int) -> int:
+    """Ordinal of the Monday that starts ISO week 1 of the year"""
     jan_4 = date(year, 1, 4)
-    week_start = (
-        jan_4 - timedelta(days=jan_4.weekday()) + timedelta(weeks=week_number - 1)
-    )
-
-    week_dates = [week_start + timedelta(days=i) for i in range(7)]
-    return [d for d in week_dates if d.year == year]
+    return jan_4.toordinal() - jan_4.weekday()
@@ -1,9 +1,11 @@
+from weakref import WeakValueDictionary
+
 from calendario.domain import Calendar
 from calendario.validation.rules import (
+    check_weekly_rest_days,
+    validate_day_sequence,
     validate_holiday_pairing,
     validate_monthly_weekends,
-    validate_no_sunday_monday_rest,
-    validate_ordering_placement,
     validate_rest_blocks,
     validate_weekly_rest,
     validate_work_block_lengths,
@@ -14,30 +16,53 @@ class ValidationError(Exception):
     """Raised when calendar validation fails"""
 
 
-def validate_calendar(calendar: Calendar) -> None:
+# REQ3 and REQ7 both walk consecutive day pairs, so they share one pass
+_RULES = (
+    validate_holiday_pairing,
+    validate_rest_blocks,
+    validate_day_sequence,
+    validate_work_block_lengths,
+    validate_monthly_weekends,
+    validate_weekly_rest,
+)
+
+# Calendars are immutable, so one that passed validation stays valid
+_VALIDATED: WeakValueDictionary[int, Calendar] = WeakValueDictionary()
+
+
+def validate_calendar(calendar: Calendar, *, fail_fast: bool = False) -> None:
     """
     Validate calendar against all requirements.
 
     Runs all 7 validation rules and raises ValidationError if any fail.
+    Calendars that already passed are not validated again.
 
     Args:
         calendar: Calendar to validate
+        fail_fast: Stop at the first rule that reports errors instead of
+            collecting the full report, after a quick check of the REST
+            day count in each week
 
     Raises:
         ValidationError: If any validation rule fails
     """
+    if _VALIDATED.get(id(calendar)) is calendar:
+        return
+
     errors = []
 
-    errors.extend(validate_holiday_pairing(calendar))
-    errors.extend(validate_rest_blocks(calendar))
-    errors.extend(validate_ordering_placement(calendar))
-    errors.extend(validate_work_block_lengths(calendar))
-    errors.extend(validate_monthly_weekends(calendar))
-    errors.extend(validate_weekly_rest(calendar))
-    errors.extend(validate_no_sunday_monday_rest(calendar))
+    # Callers that only need pass/fail may stop on the cheap count check
+    rules = (check_weekly_rest_days, *_RULES) if fail_fast else _RULES
+
+    for rule in rules:
+        errors.extend(rule(calendar))
+        if fail_fast and errors:
+            break
 
     if errors:
         error_message = "Calendar validation failed:\n" + "\n".join(
             f"  - {e}" for e in errors
         )
         raise ValidationError(error_message)
+
+    _VALIDATED[id(calendar)] = calendar
@@ -0,0 +1,28 @@
+from functools import lru_cache
+
+import pytest
+
+from calendario import generate_calendar
+
+
+@pytest.fixture(scope="session")
+def cached_generate():
+    """
+    generate_calendar memoized for the whole test session.
+
+    Calendars are immutable, so tests asking for the same (year, seed,
+    holidays) can share one instance. Holidays must be given as a tuple.
+    Tests that check determinism should call generate_calendar directly.
+    """
+
+    @lru_cache(maxsize=32)
+    def generate(year, seed, holidays=None):
+        return generate_calendar(year, holidays=holidays, seed=seed)
+
+    return generate
+
+
+@pytest.fixture(scope="session")
+def cal(cached_generate):
+    """Standard test calendar, built once since Calendar is immutable"""
+    return cached_generate(2025, 42)
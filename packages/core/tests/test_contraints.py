@@ -2,6 +2,7 @@ from datetime import date
 
 from calendario.domain import Day, DayType
 from calendario.generation.constraints import (
+    ScheduleBuilder,
     ScheduleState,
     can_place_rest_at,
     is_saturday,
@@ -139,3 +140,21 @@ def test_current_work_streak():
     )
 
     assert state.current_work_streak == 3  # ORDERING + WORK + WORK
+
+
+def test_schedule_builder_snapshot():
+    """Builder freezes into an equivalent ScheduleState"""
+    builder = ScheduleBuilder(current_date=date(2025, 1, 3))
+    builder.days_so_far.append(Day(date(2025, 1, 1), DayType.ORDERING))
+    builder.days_so_far.append(Day(date(2025, 1, 2), DayType.WORK))
+    builder.weeks_with_rest.add(1)
+    builder.last_day = builder.days_so_far[-1]
+    builder.work_streak = 2
+
+    state = builder.snapshot()
+
+    assert state.days_so_far == tuple(builder.days_so_far)
+    assert state.weeks_with_rest == frozenset([1])
+    assert state.months_with_weekend == frozenset()
+    assert state.current_work_streak == builder.current_work_streak == 2
+    assert state.last_day == builder.last_day
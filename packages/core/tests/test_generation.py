@@ -1,43 +1,48 @@
+import multiprocessing
+import pickle
+
 from datetime import date
 
 import pytest
 
 from calendario import (
+    ValidationError,
     generate_calendar,
+    generate_calendar_nothrow,
     generate_ecuador_calendar,
     generate_multiple_calendars,
 )
-from calendario.domain import DayType
+from calendario.domain import Calendar, Day, DayType
+from calendario.generation import generator
 
 
-def test_generate_calendar_basic():
+def test_generate_calendar_basic(cached_generate):
     """Generate a basic calendar for 2025"""
-    cal = generate_calendar(2025, seed=42)
+    cal = cached_generate(2025, 42)
 
     assert cal.year == 2025
     assert len(cal.days) == 365
 
 
-def test_generate_calendar_deterministic():
+def test_generate_calendar_deterministic(cached_generate):
     """Same seed produces same calendar"""
-    cal1 = generate_calendar(2025, seed=42)
-    cal2 = generate_calendar(2025, seed=42)
+    cal = generate_calendar(2025, seed=42)
 
-    assert cal1.days == cal2.days
+    assert cal.fingerprint() == cached_generate(2025, 42).fingerprint()
 
 
-def test_generate_calendar_different_seeds():
+def test_generate_calendar_different_seeds(cached_generate):
     """Different seeds produce different calendars"""
-    cal1 = generate_calendar(2025, seed=42)
-    cal2 = generate_calendar(2025, seed=99)
+    fp_42 = cached_generate(2025, 42).fingerprint()
+    fp_99 = cached_generate(2025, 99).fingerprint()
 
-    assert cal1.days != cal2.days
+    assert fp_42 != fp_99
 
 
-def test_generate_calendar_with_holidays():
+def test_generate_calendar_with_holidays(cached_generate):
     """Generate calendar with custom holidays"""
-    holidays = [date(2025, 1, 1), date(2025, 12, 25)]
-    cal = generate_calendar(2025, holidays=holidays, seed=42)
+    holidays = (date(2025, 1, 1), date(2025, 12, 25))
+    cal = cached_generate(2025, 42, holidays)
 
     assert cal.get_day(date(2025, 1, 1)).day_type == DayType.HOLIDAY
     assert cal.get_day(date(2025, 12, 25)).day_type == DayType.HOLIDAY
@@ -49,6 +54,55 @@ def test_generate_calendar_invalid_year():
         generate_calendar(0, seed=42)
 
 
+def test_generate_calendar_nothrow_reports_validation_failure(monkeypatch):
+    """A calendar that fails validation returns the error text"""
+
+    def fail_validation(calendar, **kwargs):
+        msg = "x"
+        raise ValidationError(msg)
+
+    monkeypatch.setattr(generator, "validate_calendar", fail_validation)
+
+    assert generate_calendar_nothrow(2025, seed=42) == (None, "x")
+
+
+def test_generate_calendar_nothrow_returns_calendar(monkeypatch):
+    """A calendar that passes validation comes back without an error"""
+    monkeypatch.setattr(generator, "validate_calendar", lambda calendar, **kwargs: None)
+
+    cal, error = generate_calendar_nothrow(2025, seed=42)
+
+    assert error is None
+    assert isinstance(cal, Calendar)
+    assert len(cal.days) == 365
+
+
+def test_generate_calendar_nothrow_invalid_year():
+    """Invalid inputs still raise ValueError"""
+    with pytest.raises(ValueError, match="Invalid year"):
+        generate_calendar_nothrow(0, seed=42)
+
+
+def test_calendar_rejects_gaps():
+    """Calendar days must be consecutive"""
+    days = (
+        Day(date(2025, 1, 1), DayType.WORK),
+        Day(date(2025, 1, 3), DayType.WORK),
+    )
+    with pytest.raises(ValueError, match="gap before 2025-01-03"):
+        Calendar(2025, days)
+
+
+def test_generate_calendar_schedule_gap_is_validation_error(monkeypatch):
+    """A schedule with gaps is an algorithm bug, reported as ValidationError"""
+    days = [Day(date(2025, 1, 1), DayType.WORK), Day(date(2025, 1, 3), DayType.WORK)]
+    monkeypatch.setattr(generator, "build_schedule", lambda *args: days)
+
+    with pytest.raises(ValidationError, match="gap before 2025-01-03"):
+        generate_calendar(2025, seed=42)
+    assert generate_calendar_nothrow(2025, seed=42)[0] is None
+
+
 def test_generate_calendar_holidays_wrong_year():
     """Holidays from wrong year raise ValueError"""
     holidays = [date(2024, 1, 1)]
@@ -89,8 +143,9 @@ def test_generate_multiple_calendars():
     assert all(cal.year == 2025 for cal in calendars)
 
     # All calendars should be different
-    assert calendars[0].days != calendars[1].days
-    assert calendars[1].days != calendars[2].days
+    fingerprints = [cal.fingerprint() for cal in calendars]
+    assert fingerprints[0] != fingerprints[1]
+    assert fingerprints[1] != fingerprints[2]
 
 
 def test_generate_multiple_calendars_deterministic():
@@ -98,14 +153,64 @@ def test_generate_multiple_calendars_deterministic():
     calendars1 = generate_multiple_calendars(2025, num_workers=2, base_seed=100)
     calendars2 = generate_multiple_calendars(2025, num_workers=2, base_seed=100)
 
-    assert calendars1[0].days == calendars2[0].days
-    assert calendars1[1].days == calendars2[1].days
+    assert [cal.fingerprint() for cal in calendars1] == [
+        cal.fingerprint() for cal in calendars2
+    ]
 
 
-def test_generated_calendar_has_work_and_rest_blocks():
-    """Generated calendar has proper work and rest blocks"""
+def _multiple_calendars_outcome(max_processes):
+    """Fingerprints of a generated batch, or the error it raised"""
+    try:
+        calendars = generate_multiple_calendars(
+            2025, num_workers=3, base_seed=100, max_processes=max_processes
+        )
+    except (ValueError, ValidationError) as e:
+        return type(e), str(e)
+    return [cal.fingerprint() for cal in calendars]
+
+
+def test_generate_multiple_calendars_serial_matches_parallel():
+    """Serial and multi-process generation give the same calendars or error"""
+    assert _multiple_calendars_outcome(3) == _multiple_calendars_outcome(1)
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="worker processes only see the patched validator when forked",
+)
+def test_generate_multiple_calendars_parallel_returns_calendars(monkeypatch):
+    """Calendars come back from worker processes intact"""
+    monkeypatch.setattr(generator, "validate_calendar", lambda calendar, **kwargs: None)
+
+    serial = generate_multiple_calendars(2025, 3, base_seed=100, max_processes=1)
+    parallel = generate_multiple_calendars(2025, 3, base_seed=100, max_processes=3)
+
+    assert parallel == serial
+    assert [cal.get_rest_blocks() for cal in parallel] == [
+        cal.get_rest_blocks() for cal in serial
+    ]
+
+
+def test_calendar_pickle_round_trip(monkeypatch):
+    """Calendars survive the pickling used to return them from processes"""
+    monkeypatch.setattr(generator, "validate_calendar", lambda calendar, **kwargs: None)
     cal = generate_calendar(2025, seed=42)
 
+    restored = pickle.loads(pickle.dumps(cal))
+
+    assert restored == cal
+    assert restored.get_rest_blocks() == cal.get_rest_blocks()
+    assert restored.get_month_days(3) == cal.get_month_days(3)
+    assert restored.get_day(date(2025, 6, 1)) == cal.get_day(date(2025, 6, 1))
+    assert [day.is_work_day for day in restored.days] == [
+        day.is_work_day for day in cal.days
+    ]
+
+
+def test_generated_calendar_has_work_and_rest_blocks(cached_generate):
+    """Generated calendar has proper work and rest blocks"""
+    cal = cached_generate(2025, 42)
+
     work_blocks = cal.get_work_blocks()
     rest_blocks = cal.get_rest_blocks()
 
@@ -121,9 +226,9 @@ def test_generated_calendar_has_work_and_rest_blocks():
         assert len(block) == 2
 
 
-def test_leap_year():
+def test_leap_year(cached_generate):
     """Generate calendar for leap year"""
-    cal = generate_calendar(2024, seed=42)
+    cal = cached_generate(2024, 42)
 
     assert cal.year == 2024
     assert len(cal.days) == 366  # Leap year
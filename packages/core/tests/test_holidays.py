@@ -2,71 +2,85 @@ from datetime import date
 
 import pytest
 
+from calendario.config.presets import get_ecuador_holiday_set, get_ecuador_holidays
 from calendario.domain import DayType
 from calendario.generation.holidays import process_holidays
 
 
-def test_empty_holidays():
-    """Empty list returns empty dict"""
-    assert process_holidays([]) == {}
-
-
-def test_single_isolated_holiday():
-    """Single holiday becomes HOLIDAY"""
-    holidays = [date(2025, 1, 1)]
-    result = process_holidays(holidays)
-    assert result == {date(2025, 1, 1): DayType.HOLIDAY}
-
-
-def test_multiple_isolated_holidays():
-    """Multiple isolated holidays all become HOLIDAY"""
-    holidays = [date(2025, 1, 1), date(2025, 5, 1), date(2025, 12, 25)]
-    result = process_holidays(holidays)
-    assert result == {
-        date(2025, 1, 1): DayType.HOLIDAY,
-        date(2025, 5, 1): DayType.HOLIDAY,
-        date(2025, 12, 25): DayType.HOLIDAY,
-    }
-
-
-def test_consecutive_pair():
-    """Consecutive pair: first is WORKING_HOLIDAY, second is HOLIDAY"""
-    holidays = [date(2025, 1, 1), date(2025, 1, 2)]  # Thu-Fri
-    result = process_holidays(holidays)
-    assert result == {
-        date(2025, 1, 1): DayType.WORKING_HOLIDAY,
-        date(2025, 1, 2): DayType.HOLIDAY,
-    }
-
-
-def test_sunday_monday_pair_raises():
-    """Sunday-Monday pairs are not allowed"""
-    sunday = date(2025, 3, 2)
-    monday = date(2025, 3, 3)
-    assert sunday.weekday() == 6
-    assert monday.weekday() == 0
-
-    with pytest.raises(ValueError, match="Sunday-Monday holiday pair not allowed"):
-        process_holidays([sunday, monday])
-
-
-def test_three_consecutive_raises():
-    """3+ consecutive holidays are not allowed"""
-    holidays = [date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 3)]
-    with pytest.raises(ValueError, match="Holiday block too large"):
+@pytest.mark.parametrize(
+    ("holidays", "expected"),
+    [
+        pytest.param([], {}, id="empty"),
+        pytest.param(
+            [date(2025, 1, 1)],
+            {date(2025, 1, 1): DayType.HOLIDAY},
+            id="single-isolated",
+        ),
+        pytest.param(
+            [date(2025, 1, 1), date(2025, 5, 1), date(2025, 12, 25)],
+            {
+                date(2025, 1, 1): DayType.HOLIDAY,
+                date(2025, 5, 1): DayType.HOLIDAY,
+                date(2025, 12, 25): DayType.HOLIDAY,
+            },
+            id="multiple-isolated",
+        ),
+        pytest.param(
+            [date(2025, 1, 1), date(2025, 1, 2)],  # Thu-Fri
+            {
+                date(2025, 1, 1): DayType.WORKING_HOLIDAY,
+                date(2025, 1, 2): DayType.HOLIDAY,
+            },
+            id="consecutive-pair",
+        ),
+        pytest.param(
+            [date(2025, 1, 1), date(2025, 1, 1)],
+            {date(2025, 1, 1): DayType.HOLIDAY},
+            id="duplicates",
+        ),
+    ],
+)
+def test_process_holidays(holidays, expected):
+    """Isolated holidays become HOLIDAY, pairs become WORKING_HOLIDAY + HOLIDAY"""
+    assert process_holidays(holidays) == expected
+
+
+@pytest.mark.parametrize(
+    ("holidays", "message"),
+    [
+        pytest.param(
+            [date(2025, 3, 2), date(2025, 3, 3)],  # Sun-Mon
+            "Sunday-Monday holiday pair not allowed",
+            id="sunday-monday-pair",
+        ),
+        pytest.param(
+            [date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 3)],
+            "Holiday block too large",
+            id="three-consecutive",
+        ),
+    ],
+)
+def test_invalid_holiday_patterns_raise(holidays, message):
+    """Sunday-Monday pairs and blocks of 3+ holidays are not allowed"""
+    with pytest.raises(ValueError, match=message):
         process_holidays(holidays)
 
 
-def test_handles_duplicates():
-    """Duplicate dates are deduplicated"""
-    holidays = [date(2025, 1, 1), date(2025, 1, 1)]
-    result = process_holidays(holidays)
-    assert result == {date(2025, 1, 1): DayType.HOLIDAY}
-
-
 def test_sorts_unsorted_input():
     """Unsorted input is handled correctly"""
     holidays = [date(2025, 5, 1), date(2025, 1, 1), date(2025, 12, 25)]
     result = process_holidays(holidays)
     assert len(result) == 3
     assert all(dt == DayType.HOLIDAY for dt in result.values())
+
+
+@pytest.mark.parametrize("year", [2025, 2026])
+def test_ecuador_holiday_set_matches_preset(year):
+    """The set form holds exactly the preset's holiday dates"""
+    assert get_ecuador_holiday_set(year) == frozenset(get_ecuador_holidays(year))
+
+
+def test_ecuador_holiday_set_unsupported_year():
+    """Years without a preset raise ValueError"""
+    with pytest.raises(ValueError, match="No Ecuador holidays preset"):
+        get_ecuador_holiday_set(2030)
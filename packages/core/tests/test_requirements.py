@@ -1,32 +1,28 @@
-from datetime import date, timedelta
+from collections import defaultdict
+from datetime import date
+from itertools import pairwise
 
 import pytest
 
-from calendario import generate_calendar
 from calendario.domain import DayType
 
 
 class TestAllRequirements:
     """Test suite for all 7 requirements"""
 
-    @pytest.fixture
-    def cal(self):
-        """Standard test calendar"""
-        return generate_calendar(2025, seed=42)
-
-    def test_req1_holiday_pairing(self):
+    def test_req1_holiday_pairing(self, cached_generate):
         """
         REQ1: Holiday pairing rules
         - Solitary holidays are mandatory rest (HOLIDAY)
         - Consecutive pairs have one WORKING_HOLIDAY and one HOLIDAY
         """
-        holidays = [
+        holidays = (
             date(2025, 1, 1),  # Isolated
             date(2025, 5, 1),
             date(2025, 5, 2),  # Pair
             date(2025, 12, 25),  # Isolated
-        ]
-        cal = generate_calendar(2025, holidays=holidays, seed=42)
+        )
+        cal = cached_generate(2025, 42, holidays)
 
         # Isolated holidays
         assert cal.get_day(date(2025, 1, 1)).day_type == DayType.HOLIDAY
@@ -93,52 +89,38 @@ class TestAllRequirements:
         REQ5: Exactly one free weekend (Sat-Sun REST) per month
         """
         for month in range(1, 13):
-            month_days = cal.get_month_days(month)
-            free_weekends = 0
-
-            for i in range(len(month_days) - 1):
-                day1 = month_days[i]
-                day2 = month_days[i + 1]
-
-                if (
-                    day1.date.weekday() == 5  # Saturday
-                    and day2.date.weekday() == 6  # Sunday
-                    and day1.day_type == DayType.REST
-                    and day2.day_type == DayType.REST
-                ):
-                    free_weekends += 1
+            # Day type checks first: they rule out most pairs without
+            # calling weekday()
+            free_weekends = sum(
+                1
+                for day1, day2 in pairwise(cal.get_month_days(month))
+                if day1.day_type == DayType.REST
+                and day2.day_type == DayType.REST
+                and day1.date.weekday() == 5  # Saturday
+                and day2.date.weekday() == 6  # Sunday
+            )
 
             assert free_weekends == 1, (
                 f"Month {month} has {free_weekends} free weekends, must be exactly 1"
             )
 
-    def test_req6_one_rest_per_week(self, cal):
+    def test_req6_one_rest_per_week(self, iso_weeks):
         """
         REQ6: Exactly one rest block per ISO week
         """
-        week_numbers = self._get_all_iso_weeks(cal.year)
-
-        for week_num in week_numbers:
-            week_dates = self._get_week_dates(cal.year, week_num)
-
+        for week_num, week_days in iso_weeks.items():
             # Count rest blocks in this week
             rest_blocks = 0
             i = 0
-            while i < len(week_dates):
-                try:
-                    day = cal.get_day(week_dates[i])
-                    if day.day_type == DayType.REST:
-                        # Check if next day is also REST (2-day block)
-                        if i + 1 < len(week_dates):
-                            next_day = cal.get_day(week_dates[i + 1])
-                            if next_day.day_type == DayType.REST:
-                                rest_blocks += 1
-                                i += 2
-                                continue
-                        i += 1
-                    else:
-                        i += 1
-                except KeyError:
+            while i < len(week_days):
+                if (
+                    week_days[i].day_type == DayType.REST
+                    and i + 1 < len(week_days)
+                    and week_days[i + 1].day_type == DayType.REST
+                ):
+                    rest_blocks += 1
+                    i += 2
+                else:
                     i += 1
 
             assert rest_blocks == 1, (
@@ -166,78 +148,61 @@ class TestAllRequirements:
                 )
 
     @pytest.mark.parametrize("seed", [42, 100, 200, 300, 400])
-    def test_all_requirements_multiple_seeds(self, seed):
+    def test_all_requirements_multiple_seeds(self, cached_generate, seed):
         """
         All requirements must pass for different random seeds.
 
         If generation succeeds and validation passes, all requirements are met.
         """
-        cal = generate_calendar(2025, seed=seed)
+        cal = cached_generate(2025, seed)
 
         # Just successfully generating and validating proves all requirements
         assert cal.year == 2025
         assert len(cal.days) == 365
 
     @pytest.mark.parametrize("year", [2024, 2025, 2026])
-    def test_all_requirements_multiple_years(self, year):
+    def test_all_requirements_multiple_years(self, cached_generate, year):
         """All requirements must pass for different years"""
-        cal = generate_calendar(year, seed=100)
+        cal = cached_generate(year, 100)
 
         # If it generates successfully, all requirements are met
         assert cal.year == year
 
-    # Helper methods
-
-    def _get_all_iso_weeks(self, year: int) -> list[int]:
-        """Get all ISO week numbers for the year"""
-        jan_1 = date(year, 1, 1)
-        dec_31 = date(year, 12, 31)
-
-        start_week = jan_1.isocalendar()[1]
-        end_week = dec_31.isocalendar()[1]
-
-        if start_week > 50:
-            start_week = 1
-
-        if end_week == 1:
-            dec_28 = date(year, 12, 28)
-            end_week = dec_28.isocalendar()[1]
-
-        return list(range(start_week, end_week + 1))
-
-    def _get_week_dates(self, year: int, week_number: int) -> list[date]:
-        """Get all dates in an ISO week that fall within the year"""
-        jan_4 = date(year, 1, 4)
-        week_start = (
-            jan_4 - timedelta(days=jan_4.weekday()) + timedelta(weeks=week_number - 1)
-        )
-
-        week_dates = [week_start + timedelta(days=i) for i in range(7)]
-        return [d for d in week_dates if d.year == year]
+    @pytest.fixture
+    def iso_weeks(self, cal):
+        """Days of the calendar grouped by ISO week, for weeks of its own year"""
+        weeks = defaultdict(list)
+        for day in cal.days:
+            iso_year, week_num, _ = day.date.isocalendar()
+            if iso_year == cal.year:
+                weeks[week_num].append(day)
+        return weeks
 
 
 class TestEdgeCases:
     """Test edge cases and error handling"""
 
-    def test_year_end_rest_block():
+    @pytest.mark.parametrize("seed", [42, 100])
+    def test_year_end_rest_block(self, cached_generate, seed):
         """Rest block at year end should handle gracefully"""
         # Generate calendar and check last few days
-        cal = generate_calendar(2025, seed=42)
+        cal = cached_generate(2025, seed)
 
         # Should complete without error
         assert cal.days[-1].date.year == 2025
 
-    def test_many_holidays():
+    @pytest.mark.parametrize("seed", [42, 100])
+    def test_many_holidays(self, cached_generate, seed):
         """Calendar with many holidays should still satisfy constraints"""
-        holidays = [
+        holidays = (
             date(2025, 1, 1),
             date(2025, 1, 2),
             date(2025, 2, 16),
             date(2025, 2, 17),
             date(2025, 5, 1),
             date(2025, 12, 25),
-        ]
-        cal = generate_calendar(2025, holidays=holidays, seed=42)
+        )
+        cal = cached_generate(2025, seed, holidays)
 
         # Should generate successfully
         assert len(cal.days) == 365
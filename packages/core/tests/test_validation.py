@@ -0,0 +1,191 @@
+"""
+Tests for validation rules on hand-built calendars.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from calendario.domain import Calendar, Day, DayType
+from calendario.validation import validator
+from calendario.validation.rules import (
+    check_weekly_rest_days,
+    validate_no_sunday_monday_rest,
+    validate_rest_blocks,
+    validate_weekly_rest,
+)
+from calendario.validation.validator import ValidationError, validate_calendar
+
+
+def make_calendar(year, rest_dates):
+    """Calendar of WORK days with REST on the given dates"""
+    jan_1 = date(year, 1, 1)
+    num_days = (date(year + 1, 1, 1) - jan_1).days
+    dates = (jan_1 + timedelta(days=i) for i in range(num_days))
+    return Calendar(
+        year,
+        tuple(Day(d, DayType.REST if d in rest_dates else DayType.WORK) for d in dates),
+    )
+
+
+def thursday_friday_rest(year):
+    """Every Thursday and Friday of the year"""
+    jan_1 = date(year, 1, 1)
+    num_days = (date(year + 1, 1, 1) - jan_1).days
+    dates = (jan_1 + timedelta(days=i) for i in range(num_days))
+    return {d for d in dates if d.weekday() in {3, 4}}
+
+
+def week_dates(year, week, weekdays):
+    """Dates of the given ISO weekdays (1 = Monday) in an ISO week"""
+    return {date.fromisocalendar(year, week, weekday) for weekday in weekdays}
+
+
+class TestValidateWeeklyRest:
+    def test_one_block_per_week(self):
+        """One 2-day REST block in every week is valid"""
+        cal = make_calendar(2025, thursday_friday_rest(2025))
+
+        assert validate_weekly_rest(cal) == []
+
+    def test_missing_week(self):
+        """A week without a rest block is reported"""
+        rest = thursday_friday_rest(2025) - week_dates(2025, 20, (4, 5))
+        cal = make_calendar(2025, rest)
+
+        assert validate_weekly_rest(cal) == ["Week 20 has 0 rest blocks (must be 1)"]
+
+    def test_three_day_run_counts_once(self):
+        """A 3-day REST run holds one rest block"""
+        rest = thursday_friday_rest(2025) | week_dates(2025, 10, (6,))
+        cal = make_calendar(2025, rest)
+
+        assert validate_weekly_rest(cal) == []
+
+    def test_four_day_run_counts_twice(self):
+        """A 4-day REST run inside a week holds two rest blocks"""
+        rest = thursday_friday_rest(2025) | week_dates(2025, 10, (3, 6))
+        cal = make_calendar(2025, rest)
+
+        assert validate_weekly_rest(cal) == ["Week 10 has 2 rest blocks (must be 1)"]
+
+    def test_run_split_at_week_boundary(self):
+        """A Sat-Sun-Mon-Tue run gives one rest block to each week"""
+        rest = (
+            thursday_friday_rest(2025)
+            - week_dates(2025, 10, (4, 5))
+            - week_dates(2025, 11, (4, 5))
+        )
+        rest |= week_dates(2025, 10, (6, 7)) | week_dates(2025, 11, (1, 2))
+        cal = make_calendar(2025, rest)
+
+        assert validate_weekly_rest(cal) == []
+
+    def test_sunday_monday_pair_counts_for_neither_week(self):
+        """A Sun-Mon pair is split in two single days, neither a block"""
+        rest = (
+            thursday_friday_rest(2025)
+            - week_dates(2025, 10, (4, 5))
+            - week_dates(2025, 11, (4, 5))
+        )
+        rest |= week_dates(2025, 10, (7,)) | week_dates(2025, 11, (1,))
+        cal = make_calendar(2025, rest)
+
+        assert validate_weekly_rest(cal) == [
+            "Week 10 has 0 rest blocks (must be 1)",
+            "Week 11 has 0 rest blocks (must be 1)",
+        ]
+
+    def test_days_in_previous_years_last_week_are_ignored(self):
+        """2027-01-01..03 belong to 2026-W53, so their rest is not counted"""
+        rest = thursday_friday_rest(2027) | {date(2027, 1, 2), date(2027, 1, 3)}
+        cal = make_calendar(2027, rest)
+
+        assert validate_weekly_rest(cal) == []
+
+        rest -= week_dates(2027, 1, (4, 5))
+        cal = make_calendar(2027, rest)
+
+        assert validate_weekly_rest(cal) == ["Week 1 has 0 rest blocks (must be 1)"]
+
+
+class TestCheckWeeklyRestDays:
+    def test_accepts_calendar_meeting_rest_rules(self):
+        """A calendar meeting REQ2, REQ6 and REQ7 passes the pre-check"""
+        cal = make_calendar(2025, thursday_friday_rest(2025))
+
+        assert validate_rest_blocks(cal) == []
+        assert validate_weekly_rest(cal) == []
+        assert validate_no_sunday_monday_rest(cal) == []
+        assert check_weekly_rest_days(cal) == []
+
+    def test_rejects_wrong_rest_day_count(self):
+        """Weeks with other than two REST days are reported"""
+        rest = thursday_friday_rest(2025) | week_dates(2025, 10, (6,))
+        rest -= week_dates(2025, 20, (4, 5))
+        cal = make_calendar(2025, rest)
+
+        assert check_weekly_rest_days(cal) == [
+            "Week 10 has 3 REST days (must be 2)",
+            "Week 20 has 0 REST days (must be 2)",
+        ]
+
+
+class TestValidateCalendar:
+    # Thursday-Friday rest breaks REQ3 (no ORDERING after rest) and REQ5
+    # (no free weekends)
+
+    def test_reports_every_failing_rule(self):
+        """By default the report lists errors from every failing rule"""
+        cal = make_calendar(2025, thursday_friday_rest(2025))
+
+        with pytest.raises(ValidationError) as excinfo:
+            validate_calendar(cal)
+
+        message = str(excinfo.value)
+        assert "Expected ORDERING at 2025-01-04" in message
+        assert "Month 1 has 0 free weekends" in message
+
+    def test_fail_fast_stops_at_first_failing_rule(self):
+        """fail_fast reports only the first failing rule's errors"""
+        cal = make_calendar(2025, thursday_friday_rest(2025))
+
+        with pytest.raises(ValidationError) as excinfo:
+            validate_calendar(cal, fail_fast=True)
+
+        message = str(excinfo.value)
+        assert "Expected ORDERING at 2025-01-04" in message
+        assert "free weekends" not in message
+
+    def test_passed_calendar_is_not_validated_again(self, monkeypatch):
+        """A calendar that passed is remembered and skipped next time"""
+        calls = []
+
+        def passing_rule(cal):
+            calls.append(cal)
+            return []
+
+        monkeypatch.setattr(validator, "_RULES", (passing_rule,))
+        cal = make_calendar(2025, thursday_friday_rest(2025))
+
+        validate_calendar(cal)
+        validate_calendar(cal)
+
+        assert calls == [cal]
+
+    def test_failed_calendar_is_validated_again(self, monkeypatch):
+        """A calendar that failed is checked again on the next call"""
+        calls = []
+
+        def failing_rule(cal):
+            calls.append(cal)
+            return ["broken"]
+
+        monkeypatch.setattr(validator, "_RULES", (failing_rule,))
+        cal = make_calendar(2025, thursday_friday_rest(2025))
+
+        for _ in range(2):
+            with pytest.raises(ValidationError, match="broken"):
+                validate_calendar(cal)
+
+        assert calls == [cal, cal]
@@ -2,6 +2,8 @@ import pathlib
 
 from flask import Flask
 
+from app import routes
+
 
 def create_app(test_config: dict[str, object] | None = None) -> Flask:  # noqa: RUF067
     app = Flask(__name__, instance_relative_config=True)
@@ -16,13 +18,10 @@ def create_app(test_config: dict[str, object] | None = None) -> Flask:  # noqa:
 
     # ensure the instance folder exists
     try:  # noqa: SIM105
-        pathlib.Path(app.instance_path).mkdir(parents=True)
+        pathlib.Path(app.instance_path).mkdir(parents=True, exist_ok=True)
     except OSError:
         pass
 
-    from . import routes  # noqa: TID252
-
     app.register_blueprint(routes.bp)
-    app.add_url_rule("/", endpoint="index")
 
     return app
@@ -1,13 +1,15 @@
+from datetime import date, timedelta
+from functools import lru_cache
 from random import Random
 
-from calendario.api import generate_calendar
-from calendario.core.domain import Calendar
+from calendario.api import generate_calendar_nothrow
+from calendario.domain import Calendar, DayType
 
 # Internal imports for unsafe generation fallback
-from calendario.generation.execution import execute_plan
 from calendario.generation.holidays import process_holidays
-from calendario.generation.planning import create_plan
-from flask import Blueprint, Response, jsonify, render_template, request
+from calendario.generation.schedule import build_schedule
+from flask import Blueprint, Response, abort, jsonify, render_template, request
+from werkzeug.exceptions import BadRequest
 
 
 bp = Blueprint("main", __name__)
@@ -18,31 +20,82 @@ def index() -> str:
     return render_template("index.html")
 
 
+# Enum .name is a descriptor lookup; a plain dict is cheaper per day
+_DAY_TYPE_NAMES = {day_type: day_type.name for day_type in DayType}
+
+
+@lru_cache(maxsize=8)
+def _iso_dates(year: int) -> tuple[str, ...]:
+    """ISO date strings for every day of the year, indexed by day of year - 1."""
+    jan1 = date(year, 1, 1)
+    num_days = (date(year + 1, 1, 1) - jan1).days
+    return tuple((jan1 + timedelta(days=i)).isoformat() for i in range(num_days))
+
+
 def serialize_calendar(calendar: Calendar) -> dict[str, object]:
+    # Per-day fields go out as parallel tuples, so the JSON carries no
+    # repeated keys and cached payloads can't be edited in place. Calendar
+    # days are consecutive, so the ISO strings are a slice of the per-year
+    # table
+    offset = calendar.days[0].date.timetuple().tm_yday - 1
+    days = calendar.days
     return {
         "year": calendar.year,
-        "days": [
-            {
-                "date": day.date.isoformat(),
-                "day_type": day.day_type.name,
-                "is_work_day": day.is_work_day,
-                "is_rest_day": day.is_rest_day,
-            }
-            for day in calendar.days
-        ],
+        "dates": _iso_dates(calendar.year)[offset : offset + len(days)],
+        "day_types": tuple(_DAY_TYPE_NAMES[day.day_type] for day in days),
+        "is_work": tuple(day.is_work_day for day in days),
+        "is_rest": tuple(day.is_rest_day for day in days),
     }
 
 
+# Valid generation attempts per worker before falling back to unsafe
+_MAX_ATTEMPTS = 5
+
+
+def _mix_seed(worker_idx: int, year: int, attempt: int) -> int:
+    """Deterministic seed for a worker's generation attempt."""
+    # Integer mixing instead of hash() on a string, whose result changes
+    # between processes unless PYTHONHASHSEED is fixed
+    return (worker_idx * 2654435761 ^ year * 40503 ^ attempt * 2246822519) & 0x7FFFFFFF
+
+
 def generate_calendar_unsafe(year: int, seed: int | None = None) -> Calendar:
     """Generate calendar without validation to ensure UI has something to show."""
     rng = Random(seed) if seed is not None else Random()
     holiday_map = process_holidays([])
-    plan = create_plan(year, holiday_map, rng)
-    return execute_plan(plan)
+    return Calendar(year, build_schedule(year, holiday_map, rng))
+
+
+def _generate_worker_calendar(worker_idx: int, year: int) -> Calendar:
+    """Generate one worker's calendar, falling back to unsafe generation."""
+    # Try a few times to get a valid one
+    for attempt in range(_MAX_ATTEMPTS):
+        cal, _ = generate_calendar_nothrow(
+            year, seed=_mix_seed(worker_idx, year, attempt)
+        )
+        if cal is not None:
+            return cal
+
+    # Use a specific seed for unsafe too so it's deterministic
+    return generate_calendar_unsafe(
+        year, seed=_mix_seed(worker_idx, year, _MAX_ATTEMPTS)
+    )
+
+
+@lru_cache(maxsize=128)
+def _serialized_worker_calendar(year: int, worker_idx: int) -> dict[str, object]:
+    """
+    Serialized calendar for one worker.
+
+    Seeds depend only on the year and worker index, so a worker's calendar
+    does not change with the size of the request and is safe to cache.
+    The per-day fields are tuples; callers copy the outer dict before use.
+    """
+    return serialize_calendar(_generate_worker_calendar(worker_idx, year))
 
 
 @bp.route("/api/generate", methods=["POST"])
-def generate() -> Response | tuple[Response, int]:
+def generate() -> Response:
     try:
         data = request.get_json()
         year = int(data.get("year", 2025))
@@ -51,37 +104,23 @@ def generate() -> Response | tuple[Response, int]:
         if not workers:
             workers = ["Worker 1"]
 
-        calendars_data = []
-
-        for worker_name in workers:
-            cal = None
-            # Try valid generation first
-            try:
-                # Try a few times to get a valid one
-                for attempt in range(5):
-                    try:
-                        seed = hash(f"{worker_name}-{year}-{attempt}") % 10000000
-                        cal = generate_calendar(year, seed=seed)
-                        break
-                    except Exception:  # noqa: BLE001
-                        continue
-            except Exception:  # noqa: BLE001
-                pass
-
-            # Fallback to unsafe if failed
-            if cal is None:
-                # Use a specific seed for unsafe too so it's deterministic
-                seed = hash(f"{worker_name}-{year}-unsafe") % 10000000
-                cal = generate_calendar_unsafe(year, seed=seed)
-
-            calendars_data.append(
-                {"worker": worker_name, "data": serialize_calendar(cal)}
-            )
+        calendars_data = [
+            {
+                "worker": worker_name,
+                "data": dict(_serialized_worker_calendar(year, idx)),
+            }
+            for idx, worker_name in enumerate(workers)
+        ]
 
         return jsonify({"calendars": calendars_data})
 
     except (TypeError, ValueError, KeyError) as e:
-        return jsonify({"error": str(e)}), 400
+        abort(400, description=str(e))
+
+
+@bp.app_errorhandler(400)
+def bad_request(e: BadRequest) -> tuple[Response, int]:
+    return jsonify({"error": e.description}), 400
 
 
 @bp.route("/api/save", methods=["POST"])
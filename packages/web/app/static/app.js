@@ -90,10 +90,13 @@ document.addEventListener('DOMContentLoaded', () => {
             const wrapper = document.createElement('div');
             wrapper.className = 'calendar-wrapper';
 
+            // Days arrive as parallel arrays indexed by position
+            const data = cal.data;
+            const days = data.dates.map((date, i) => ({ date, day_type: data.day_types[i] }));
+
             // Generate stats
-            const days = cal.data.days;
-            const workDays = days.filter(d => d.is_work_day).length;
-            const restDays = days.filter(d => d.is_rest_day).length;
+            const workDays = data.is_work.filter(Boolean).length;
+            const restDays = data.is_rest.filter(Boolean).length;
 
             wrapper.innerHTML = `
                 <div class="worker-title">